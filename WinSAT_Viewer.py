@@ -1,18 +1,75 @@
+import functools
 import json
 import os
+import queue
 import subprocess
 import threading
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+try:
+    # Optional: pywin32 lets us query WMI in-process instead of launching PowerShell.
+    import pythoncom
+    import win32com.client
+except ImportError:
+    pythoncom = None
+    win32com = None
 
-APP_TITLE = "WinSAT (Win32_WinSAT) Viewer — Windows 10"
+try:
+    # Optional: faster JSON parser. Like json.loads it accepts str or bytes and
+    # raises a ValueError subclass on bad input.
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 
+APP_TITLE = "WinSAT (Win32_WinSAT) Viewer — Windows 10"
+
+# Separates `winsat formal` output from the Win32_WinSAT JSON in the assessment script.
+ASSESSMENT_JSON_SENTINEL = "----JSON----"
+
+# Win32_WinSAT properties shown by the app.
+# Note: Win10 commonly exposes WinSATAssessmentState (not AssessmentState).
+WINSAT_FIELDS = (
+    "CPUScore",
+    "D3DScore",
+    "DiskScore",
+    "MemoryScore",
+    "GraphicsScore",
+    "WinSPRLevel",
+    "TimeTaken",
+    "WinSATAssessmentState",
+)
+WINSAT_WQL = f"SELECT {', '.join(WINSAT_FIELDS)} FROM Win32_WinSAT"
+
+# (UI label, Win32_WinSAT property) in display order.
+_SCORE_FIELDS = (
+    ("WinSPRLevel (Base Score)", "WinSPRLevel"),
+    ("CPUScore", "CPUScore"),
+    ("MemoryScore", "MemoryScore"),
+    ("DiskScore", "DiskScore"),
+    ("GraphicsScore", "GraphicsScore"),
+    ("D3DScore", "D3DScore"),
+    ("WinSATAssessmentState", "WinSATAssessmentState"),
+    ("TimeTaken", "TimeTaken"),
+)
+
+# Last successful query result, shown on startup before PowerShell is run.
+CACHE_PATH = os.path.join(
+    os.environ.get("LOCALAPPDATA", os.path.expanduser("~")), "WinSATViewer", "cache.json"
+)
+
+
+@functools.lru_cache(maxsize=1)
 def resolve_powershell_path() -> str:
     """
     Resolve a reliable path to Windows PowerShell on Windows 10.
     Handles PATH issues and 32-bit Python on 64-bit Windows (Sysnative).
+
+    The result is cached: the path does not change while the app is running.
     """
     system_root = os.environ.get("SystemRoot", r"C:\Windows")
 
@@ -34,7 +91,8 @@ def resolve_powershell_path() -> str:
 def run_powershell(ps_script: str, timeout_sec: int = 30) -> tuple[int, str, str]:
     """
     Run PowerShell with a script and return (returncode, stdout, stderr).
-    Uses -NoProfile and Bypass policy for reliability.
+    Uses -NoProfile and Bypass policy for reliability; -NonInteractive, -NoLogo
+    and -InputFormat None skip host setup the scripts never use.
 
     NOTE: Uses resolved absolute path to avoid PATH-related failures.
     """
@@ -42,51 +100,112 @@ def run_powershell(ps_script: str, timeout_sec: int = 30) -> tuple[int, str, str
     cmd = [
         ps_exe,
         "-NoProfile",
+        "-NonInteractive",
+        "-NoLogo",
+        "-InputFormat",
+        "None",
         "-ExecutionPolicy",
         "Bypass",
         "-Command",
         ps_script,
     ]
+
+    # Keep PowerShell from flashing a console window when launched from pythonw / a --windowed EXE.
+    popen_kwargs = {}
+    if os.name == "nt":
+        si = subprocess.STARTUPINFO()
+        si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        si.wShowWindow = subprocess.SW_HIDE
+        popen_kwargs["startupinfo"] = si
+        popen_kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW | subprocess.CREATE_NEW_PROCESS_GROUP
+
     try:
-        p = subprocess.run(
+        p = subprocess.Popen(
             cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout_sec,
-            encoding="utf-8",
-            errors="replace",
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            **popen_kwargs,
         )
-        return p.returncode, p.stdout.strip(), p.stderr.strip()
     except FileNotFoundError:
         return 127, "", f"PowerShell executable not found at: {ps_exe}"
+
+    try:
+        out_b, err_b = p.communicate(timeout=timeout_sec)
     except subprocess.TimeoutExpired:
+        p.kill()
+        p.communicate()
         return 124, "", f"PowerShell timed out after {timeout_sec} seconds."
 
+    # Capture raw bytes and decode once rather than through a text-mode wrapper.
+    out = out_b.decode("utf-8", "replace").strip()
+    err = err_b.decode("utf-8", "replace").strip()
+    return p.returncode, out, err
 
-def ps_query_winsat_json() -> str:
-    # Note: Win10 commonly exposes WinSATAssessmentState (not AssessmentState).
-    return r"""
-$ErrorActionPreference = "Stop"
-function Get-WinsatObj {
-  try { return Get-CimInstance -ClassName Win32_WinSAT -Namespace root\cimv2 }
-  catch { return Get-WmiObject -Class Win32_WinSAT -Namespace root\cimv2 }
-}
-$w = Get-WinsatObj
-if (-not $w) { throw "No Win32_WinSAT instance returned. WinSAT may not be available on this system." }
 
-$wPicked = $w | Sort-Object -Property TimeTaken -Descending -ErrorAction SilentlyContinue | Select-Object -First 1
+# The WQL column list keeps the query to the fields we display; the final
+# Select-Object strips the CIM metadata properties before JSON conversion.
+PS_QUERY_WINSAT_JSON = f"""
+$ErrorActionPreference = "Stop"
+$w = Get-CimInstance -Namespace root/cimv2 -Query "{WINSAT_WQL}"
+if (-not $w) {{ throw "No Win32_WinSAT instance returned. WinSAT may not be available on this system." }}
 
-$wPicked |
-  Select-Object CPUScore, D3DScore, DiskScore, MemoryScore, GraphicsScore, WinSPRLevel, TimeTaken, WinSATAssessmentState |
-  ConvertTo-Json -Depth 3
+$w |
+  Sort-Object -Property TimeTaken -Descending -ErrorAction SilentlyContinue | Select-Object -First 1 |
+  Select-Object {", ".join(WINSAT_FIELDS)} |
+  ConvertTo-Json -Depth 3 -Compress
 """
 
-
-def ps_run_winsat_assessment() -> str:
-    return r"""
+# Re-queries Win32_WinSAT in the same PowerShell process once the assessment
+# finishes; the JSON follows ASSESSMENT_JSON_SENTINEL on stdout.
+PS_RUN_WINSAT_ASSESSMENT = (
+    r"""
 $ErrorActionPreference = "Stop"
 winsat formal | Out-String
+if ($LASTEXITCODE -ne 0) { exit $LASTEXITCODE }
 """
+    + f"Write-Output '{ASSESSMENT_JSON_SENTINEL}'\n"
+    + PS_QUERY_WINSAT_JSON
+)
+
+
+def _wmi_value(v):
+    # Scores are CIM real32 values that COM widens to double (9.1 -> 9.100000381469727).
+    # Round back to float32 precision so they print, and serialise, like the PowerShell path.
+    if isinstance(v, float):
+        return float(f"{v:.7g}")
+    return v
+
+
+def query_winsat_wmi() -> dict:
+    """
+    Query Win32_WinSAT in-process through pywin32 (COM) and return the newest instance.
+    Same fields and selection as PS_QUERY_WINSAT_JSON, without a PowerShell launch.
+    """
+    pythoncom.CoInitialize()
+    result = None
+    error = None
+    try:
+        result = win32com.client.GetObject(r"winmgmts:root\cimv2").ExecQuery(WINSAT_WQL)
+        rows = [{f: _wmi_value(getattr(row, f)) for f in WINSAT_FIELDS} for row in result]
+    except Exception as e:
+        # Keep only the message: the traceback would hold COM objects past CoUninitialize().
+        error = str(e)
+    finally:
+        result = None
+        pythoncom.CoUninitialize()
+
+    if error is not None:
+        raise RuntimeError(error)
+    if not rows:
+        raise RuntimeError("No Win32_WinSAT instance returned. WinSAT may not be available on this system.")
+    return max(rows, key=lambda r: r["TimeTaken"] or "")
+
+
+_STATE_MAP = {
+    0: "0 (Not run/Unknown)",
+    1: "1 (Valid/Completed)",
+}
 
 
 def decode_assessment_state(v) -> str:
@@ -98,14 +217,49 @@ def decode_assessment_state(v) -> str:
     """
     try:
         iv = int(v)
-    except Exception:
+    except (TypeError, ValueError, OverflowError):
         return str(v)
+    return _STATE_MAP.get(iv, f"{iv} (Unknown meaning)")
 
-    if iv == 1:
-        return "1 (Valid/Completed)"
-    if iv == 0:
-        return "0 (Not run/Unknown)"
-    return f"{iv} (Unknown meaning)"
+
+def parse_winsat_json(raw: str | bytes) -> dict:
+    """
+    Parse the ConvertTo-Json output of the Win32_WinSAT query into a single object.
+    """
+    obj = _loads(raw)
+    if isinstance(obj, list) and obj:
+        obj = obj[0]
+    if not isinstance(obj, dict):
+        raise ValueError("Unexpected JSON structure (not an object).")
+    return obj
+
+
+def load_cached_result() -> tuple[str, float] | None:
+    """
+    Return (raw_json, saved_at) from the on-disk cache, or None if unavailable.
+    """
+    try:
+        with open(CACHE_PATH, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        saved_at = float(cached["saved_at"])
+        # Rejects NaN / out-of-range timestamps here rather than in the caller.
+        time.localtime(saved_at)
+        return str(cached["raw_json"]), saved_at
+    except (OSError, ValueError, OverflowError, KeyError, TypeError):
+        return None
+
+
+def save_cached_result(raw_json: str) -> None:
+    """
+    Persist the last successful query result. Failures are ignored: the cache
+    only speeds up the next launch.
+    """
+    try:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        with open(CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump({"raw_json": raw_json, "saved_at": time.time()}, f)
+    except OSError:
+        pass
 
 
 class WinSatGUI(tk.Tk):
@@ -116,11 +270,27 @@ class WinSatGUI(tk.Tk):
         self.minsize(720, 480)
 
         self.raw_json: str | None = None
+        # True while a query/assessment is in flight; entry points bail out instead of queueing more work.
+        self._busy = False
+
+        # One reusable worker thread; jobs run one at a time in submission order.
+        self._jobs: queue.Queue = queue.Queue()
+        threading.Thread(target=self._run_jobs, daemon=True).start()
 
         self._build_ui()
         self._set_busy(False)
+        self._load_cached_scores()
+
+        self.after_idle(self.refresh_scores)
 
-        self.after(200, self.refresh_scores)
+    def _run_jobs(self):
+        while True:
+            job = self._jobs.get()
+            try:
+                job()
+            except Exception as e:
+                # Keep the worker alive and don't leave the UI stuck in the busy state.
+                self.after(0, lambda e=e: self._set_busy(False, f"Error: {e}"))
 
     def _build_ui(self):
         outer = ttk.Frame(self, padding=12)
@@ -155,16 +325,7 @@ class WinSatGUI(tk.Tk):
         grid = ttk.Frame(score_frame)
         grid.pack(fill="x", expand=False)
 
-        self.fields = {
-            "WinSPRLevel (Base Score)": tk.StringVar(value="-"),
-            "CPUScore": tk.StringVar(value="-"),
-            "MemoryScore": tk.StringVar(value="-"),
-            "DiskScore": tk.StringVar(value="-"),
-            "GraphicsScore": tk.StringVar(value="-"),
-            "D3DScore": tk.StringVar(value="-"),
-            "WinSATAssessmentState": tk.StringVar(value="-"),
-            "TimeTaken": tk.StringVar(value="-"),
-        }
+        self.fields = {label: tk.StringVar(value="-") for label, _ in _SCORE_FIELDS}
 
         for r, (label, var) in enumerate(self.fields.items()):
             ttk.Label(grid, text=f"{label}:", width=30).grid(row=r, column=0, sticky="w", pady=3)
@@ -180,10 +341,13 @@ class WinSatGUI(tk.Tk):
         # Diagnostics footer (shows the resolved PowerShell path)
         diag = ttk.Frame(outer)
         diag.pack(fill="x", pady=(8, 0))
-        self.ps_path_var = tk.StringVar(value=f"PowerShell: {resolve_powershell_path()}")
+        # Resolved once the window is up to keep the path lookup off first paint.
+        self.ps_path_var = tk.StringVar(value="PowerShell: (resolving…)")
         ttk.Label(diag, textvariable=self.ps_path_var).pack(side="left")
+        self.after_idle(lambda: self.ps_path_var.set(f"PowerShell: {resolve_powershell_path()}"))
 
     def _set_busy(self, busy: bool, msg: str = ""):
+        self._busy = busy
         if busy:
             self.status_var.set(msg or "Working…")
             self.refresh_btn.configure(state="disabled")
@@ -198,8 +362,17 @@ class WinSatGUI(tk.Tk):
             self.configure(cursor="")
 
     def _log(self, s: str):
+        self._log_many([s])
+
+    def _log_many(self, lines: list[str]):
+        # One state toggle / insert / see for the whole batch instead of per line.
+        # Text.insert takes alternating (chars, tags) pairs, so the newlines are passed
+        # as separate segments rather than concatenated onto (possibly multi-KB) lines.
+        args = []
+        for line in lines:
+            args += (line, (), "\n", ())
         self.text.configure(state="normal")
-        self.text.insert("end", s + "\n")
+        self.text.insert("end", *args)
         self.text.see("end")
         self.text.configure(state="disabled")
 
@@ -209,17 +382,7 @@ class WinSatGUI(tk.Tk):
         self.text.configure(state="disabled")
 
     def _apply_scores(self, obj: dict):
-        mapping = {
-            "WinSPRLevel (Base Score)": "WinSPRLevel",
-            "CPUScore": "CPUScore",
-            "MemoryScore": "MemoryScore",
-            "DiskScore": "DiskScore",
-            "GraphicsScore": "GraphicsScore",
-            "D3DScore": "D3DScore",
-            "WinSATAssessmentState": "WinSATAssessmentState",
-            "TimeTaken": "TimeTaken",
-        }
-        for ui_label, key in mapping.items():
+        for ui_label, key in _SCORE_FIELDS:
             val = obj.get(key, None)
             if val is None:
                 self.fields[ui_label].set("-")
@@ -229,6 +392,22 @@ class WinSatGUI(tk.Tk):
                 else:
                     self.fields[ui_label].set(str(val))
 
+    def _load_cached_scores(self):
+        cached = load_cached_result()
+        if cached is None:
+            return
+        raw, saved_at = cached
+        try:
+            obj = parse_winsat_json(raw)
+        except ValueError:
+            return
+
+        self.raw_json = raw
+        self._apply_scores(obj)
+        saved = time.strftime("%Y-%m-%d %H:%M", time.localtime(saved_at))
+        self._log_many([f"Cached result from {saved}:", raw])
+        self.status_var.set(f"Showing cached scores ({saved}).")
+
     def copy_json(self):
         if not self.raw_json:
             messagebox.showinfo(APP_TITLE, "No JSON available yet. Click Refresh first.")
@@ -238,23 +417,35 @@ class WinSatGUI(tk.Tk):
         self.status_var.set("JSON copied to clipboard.")
 
     def refresh_scores(self):
+        if self._busy:
+            return
+
         def worker():
             self._clear_log()
+            if win32com is not None:
+                self._log("Querying Win32_WinSAT via WMI…")
+                try:
+                    obj = query_winsat_wmi()
+                except Exception as e:
+                    self._log(f"WMI query failed ({e}); falling back to PowerShell.")
+                else:
+                    # Compact, like the ConvertTo-Json -Compress output of the PowerShell path.
+                    out = json.dumps(obj, default=str, separators=(",", ":"))
+                    self.after(0, lambda: self._handle_query_result(0, out, "", obj))
+                    return
+
             self._log("Querying Win32_WinSAT via PowerShell…")
-            rc, out, err = run_powershell(ps_query_winsat_json(), timeout_sec=30)
+            rc, out, err = run_powershell(PS_QUERY_WINSAT_JSON, timeout_sec=30)
             self.after(0, lambda: self._handle_query_result(rc, out, err))
 
         self._set_busy(True, "Querying Win32_WinSAT…")
-        threading.Thread(target=worker, daemon=True).start()
+        self._jobs.put(worker)
 
-    def _handle_query_result(self, rc: int, out: str, err: str):
+    def _handle_query_result(self, rc: int, out: str, err: str, obj: dict | None = None):
+        done_msg = ""
         try:
             if rc != 0:
-                self._log(f"[ERROR] PowerShell exit code: {rc}")
-                if err:
-                    self._log(err)
-                if out:
-                    self._log(out)
+                self._log_many([f"[ERROR] PowerShell exit code: {rc}"] + [s for s in (err, out) if s])
                 messagebox.showerror(APP_TITLE, "Failed to query Win32_WinSAT.\nSee log for details.")
                 return
 
@@ -263,38 +454,46 @@ class WinSatGUI(tk.Tk):
                 messagebox.showerror(APP_TITLE, "PowerShell returned no output.")
                 return
 
-            self.raw_json = out
-            self._log("Raw JSON:")
-            self._log(out)
+            # Scores only change when `winsat formal` runs; an identical payload needs no re-parse.
+            if out == self.raw_json:
+                self._log_many(["Raw JSON (unchanged):", out])
+                done_msg = "Unchanged."
+                return
 
-            obj = json.loads(out)
-            if isinstance(obj, list) and obj:
-                obj = obj[0]
-            if not isinstance(obj, dict):
-                raise ValueError("Unexpected JSON structure (not an object).")
+            self._log_many(["Raw JSON:", out])
 
+            if obj is None:
+                obj = parse_winsat_json(out)
             self._apply_scores(obj)
-            self.status_var.set("WinSAT scores updated.")
+            # Only remember payloads that were applied, so a failed parse is retried next time.
+            self.raw_json = out
+            save_cached_result(out)
+            done_msg = "WinSAT scores updated."
         except Exception as e:
             self._log(f"[ERROR] {e}")
             messagebox.showerror(APP_TITLE, f"Could not parse/display results:\n{e}")
         finally:
-            self._set_busy(False)
+            self._set_busy(False, done_msg)
 
     def run_assessment(self):
+        if self._busy:
+            return
+
         def worker():
             self._clear_log()
-            self._log("Running: winsat formal …")
-            self._log("Note: this can take a while and may require Administrator privileges.\n")
-            rc, out, err = run_powershell(ps_run_winsat_assessment(), timeout_sec=600)
+            self._log_many(
+                [
+                    "Running: winsat formal …",
+                    "Note: this can take a while and may require Administrator privileges.\n",
+                ]
+            )
+            rc, out, err = run_powershell(PS_RUN_WINSAT_ASSESSMENT, timeout_sec=600)
 
             def done():
-                if rc != 0:
-                    self._log(f"[ERROR] WinSAT exit code: {rc}")
-                    if err:
-                        self._log(err)
-                    if out:
-                        self._log(out)
+                # The sentinel is only written once `winsat formal` has succeeded; without it
+                # the assessment itself failed. Failures after it belong to the re-query.
+                if ASSESSMENT_JSON_SENTINEL not in out:
+                    self._log_many([f"[ERROR] WinSAT exit code: {rc}"] + [s for s in (err, out) if s])
                     messagebox.showerror(
                         APP_TITLE,
                         "WinSAT assessment failed.\nTry running this program from an elevated (Admin) terminal.\nSee log for details.",
@@ -302,25 +501,22 @@ class WinSatGUI(tk.Tk):
                     self._set_busy(False, "Ready.")
                     return
 
-                if out:
-                    self._log("WinSAT output:")
-                    self._log(out)
-                if err:
-                    self._log("WinSAT stderr:")
-                    self._log(err)
-
-                self._log("\nRe-querying Win32_WinSAT…\n")
-                self._set_busy(True, "Re-querying Win32_WinSAT…")
-                threading.Thread(target=self._refresh_after_assessment, daemon=True).start()
+                winsat_out, _, json_out = out.partition(ASSESSMENT_JSON_SENTINEL)
+                winsat_out = winsat_out.strip()
+                lines = []
+                if winsat_out:
+                    lines += ["WinSAT output:", winsat_out]
+                # On a failed re-query stderr is reported by _handle_query_result instead.
+                if err and rc == 0:
+                    lines += ["WinSAT stderr:", err]
+                lines.append("\nUpdated Win32_WinSAT scores:\n")
+                self._log_many(lines)
+                self._handle_query_result(rc, json_out.strip(), err)
 
             self.after(0, done)
 
         self._set_busy(True, "Running WinSAT formal…")
-        threading.Thread(target=worker, daemon=True).start()
-
-    def _refresh_after_assessment(self):
-        rc, out, err = run_powershell(ps_query_winsat_json(), timeout_sec=30)
-        self.after(0, lambda: self._handle_query_result(rc, out, err))
+        self._jobs.put(worker)
 
 
 def main():